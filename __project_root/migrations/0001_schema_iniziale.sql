@@ -0,0 +1,139 @@
+-- Schema di base: tabelle create storicamente da init_db().
+-- Idempotente, così i database già esistenti vengono solo "marcati" alla versione 1.
+
+CREATE TABLE IF NOT EXISTS zone (
+    id SERIAL PRIMARY KEY,
+    nome TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS categorie (
+    id SERIAL PRIMARY KEY,
+    nome TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS prodotti (
+    id SERIAL PRIMARY KEY,
+    nome TEXT NOT NULL,
+    categoria_id INTEGER REFERENCES categorie(id)
+);
+
+CREATE TABLE IF NOT EXISTS clienti (
+    id SERIAL PRIMARY KEY,
+    nome TEXT NOT NULL,
+    zona TEXT NOT NULL,
+    fatturato_totale REAL DEFAULT 0,
+    data_registrazione TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS fatturato (
+    id SERIAL PRIMARY KEY,
+    cliente_id INTEGER NOT NULL REFERENCES clienti(id),
+    prodotto_id INTEGER REFERENCES prodotti(id),
+    quantita INTEGER NOT NULL DEFAULT 0,
+    mese INTEGER NOT NULL,
+    anno INTEGER NOT NULL,
+    totale REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS clienti_prodotti (
+    cliente_id INTEGER NOT NULL REFERENCES clienti(id) ON DELETE CASCADE,
+    prodotto_id INTEGER NOT NULL REFERENCES prodotti(id) ON DELETE CASCADE,
+    PRIMARY KEY (cliente_id, prodotto_id)
+);
+
+CREATE TABLE IF NOT EXISTS prodotti_rimossi (
+    id SERIAL PRIMARY KEY,
+    prodotto_id INTEGER NOT NULL REFERENCES prodotti(id),
+    data_rimozione TIMESTAMP NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS promo_scadenze_prodotti (
+    id SERIAL PRIMARY KEY,
+    codice TEXT,
+    nome TEXT,
+    prezzo REAL,
+    um TEXT,
+    scadenza TEXT,
+    quantita TEXT,
+    prodotto_id INTEGER REFERENCES prodotti(id) ON DELETE SET NULL
+);
+
+CREATE TABLE IF NOT EXISTS fatturato_settimanale (
+    id SERIAL PRIMARY KEY,
+    cliente_id INTEGER NOT NULL REFERENCES clienti(id) ON DELETE CASCADE,
+    settimana INTEGER NOT NULL,
+    anno INTEGER NOT NULL,
+    totale REAL NOT NULL DEFAULT 0,
+    note TEXT,
+    data_inserimento TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS acquisti_settimanali_pdf (
+    id SERIAL PRIMARY KEY,
+    cliente_id INTEGER NOT NULL REFERENCES clienti(id) ON DELETE CASCADE,
+    settimana INTEGER NOT NULL,
+    anno INTEGER NOT NULL,
+    nome_file TEXT,
+    data_caricamento TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS acquisti_settimanali_dettaglio (
+    id SERIAL PRIMARY KEY,
+    cliente_id INTEGER NOT NULL REFERENCES clienti(id) ON DELETE CASCADE,
+    settimana INTEGER NOT NULL,
+    anno INTEGER NOT NULL,
+    prodotto_id INTEGER REFERENCES prodotti(id) ON DELETE CASCADE,
+    codice_pdf TEXT,
+    nome_pdf TEXT,
+    um_pdf TEXT,
+    prezzo_pdf REAL DEFAULT 0,
+    quantita INTEGER DEFAULT 1
+);
+
+CREATE TABLE IF NOT EXISTS promozioni_pdf (
+    id SERIAL PRIMARY KEY,
+    prodotto_id INTEGER,
+    data_caricamento TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    tipo VARCHAR(50),
+    prezzo VARCHAR(50),
+    scadenza TEXT
+);
+
+CREATE TABLE IF NOT EXISTS volantini_beta (
+    id SERIAL PRIMARY KEY,
+    nome TEXT NOT NULL,
+    layout_json TEXT NOT NULL,
+    tipo TEXT DEFAULT 'volantino',
+    thumbnail TEXT,
+    creato_il TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS volantini_sfondi (
+    id SERIAL PRIMARY KEY,
+    nome TEXT NOT NULL,
+    immagine TEXT NOT NULL,
+    data_creazione TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Colonne aggiunte nel tempo (prima erano ALTER "a tentativi" in init_db)
+ALTER TABLE clienti_prodotti ADD COLUMN IF NOT EXISTS potenziale BOOLEAN DEFAULT FALSE;
+ALTER TABLE fatturato ADD COLUMN IF NOT EXISTS prodotto_id INTEGER;
+ALTER TABLE fatturato ADD COLUMN IF NOT EXISTS quantita INTEGER DEFAULT 0;
+ALTER TABLE fatturato_settimanale ADD COLUMN IF NOT EXISTS data_inizio DATE;
+ALTER TABLE fatturato_settimanale ADD COLUMN IF NOT EXISTS data_fine DATE;
+ALTER TABLE fatturato_settimanale ADD COLUMN IF NOT EXISTS mese INTEGER;
+ALTER TABLE acquisti_settimanali_pdf ADD COLUMN IF NOT EXISTS data_inizio DATE;
+ALTER TABLE acquisti_settimanali_pdf ADD COLUMN IF NOT EXISTS data_fine DATE;
+ALTER TABLE acquisti_settimanali_dettaglio ADD COLUMN IF NOT EXISTS update_id INTEGER;
+ALTER TABLE acquisti_settimanali_dettaglio ADD COLUMN IF NOT EXISTS data_inizio DATE;
+ALTER TABLE acquisti_settimanali_dettaglio ADD COLUMN IF NOT EXISTS data_fine DATE;
+ALTER TABLE promo_scadenze_prodotti ADD COLUMN IF NOT EXISTS scadenza TEXT;
+ALTER TABLE promo_scadenze_prodotti ADD COLUMN IF NOT EXISTS quantita TEXT;
+ALTER TABLE prodotti ADD COLUMN IF NOT EXISTS codice TEXT;
+ALTER TABLE prodotti ADD COLUMN IF NOT EXISTS prezzo NUMERIC;
+ALTER TABLE prodotti ADD COLUMN IF NOT EXISTS prezzo_con_simbolo TEXT;
+ALTER TABLE prodotti ADD COLUMN IF NOT EXISTS is_promo_mensile BOOLEAN DEFAULT FALSE;
+ALTER TABLE prodotti ADD COLUMN IF NOT EXISTS immagine TEXT;
+ALTER TABLE prodotti ADD COLUMN IF NOT EXISTS img_zoom NUMERIC DEFAULT 1.0;
+ALTER TABLE prodotti ADD COLUMN IF NOT EXISTS img_pos_x INTEGER DEFAULT 50;
+ALTER TABLE prodotti ADD COLUMN IF NOT EXISTS img_pos_y INTEGER DEFAULT 50;
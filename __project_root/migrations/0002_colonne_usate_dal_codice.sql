@@ -0,0 +1,47 @@
+-- Tabelle e colonne usate dalle route ma finora create solo a mano in produzione
+-- (scheda cliente, import PDF, visite, preferenze WhatsApp).
+
+CREATE TABLE IF NOT EXISTS fornitori (
+    id SERIAL PRIMARY KEY,
+    nome TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS visite (
+    id SERIAL PRIMARY KEY,
+    cliente_id INTEGER NOT NULL REFERENCES clienti(id) ON DELETE CASCADE,
+    data_visita DATE NOT NULL,
+    ora_visita TIME,
+    note TEXT,
+    completata BOOLEAN DEFAULT FALSE
+);
+
+CREATE TABLE IF NOT EXISTS whatsapp_preferenze (
+    cliente_id INTEGER PRIMARY KEY REFERENCES clienti(id) ON DELETE CASCADE,
+    ricevi_scadenza BOOLEAN DEFAULT FALSE,
+    ricevi_pesce BOOLEAN DEFAULT FALSE,
+    ricevi_carne BOOLEAN DEFAULT FALSE,
+    opt_out BOOLEAN DEFAULT FALSE,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+ALTER TABLE prodotti ADD COLUMN IF NOT EXISTS eliminato BOOLEAN DEFAULT FALSE;
+ALTER TABLE categorie ADD COLUMN IF NOT EXISTS immagine TEXT;
+ALTER TABLE prodotti_rimossi ADD COLUMN IF NOT EXISTS cliente_id INTEGER;
+
+ALTER TABLE clienti ADD COLUMN IF NOT EXISTS stato TEXT;
+ALTER TABLE clienti ADD COLUMN IF NOT EXISTS telefono TEXT;
+ALTER TABLE clienti ADD COLUMN IF NOT EXISTS giorni_consegna_standard TEXT;
+ALTER TABLE clienti ADD COLUMN IF NOT EXISTS giorno_visita_standard TEXT;
+ALTER TABLE clienti ADD COLUMN IF NOT EXISTS frequenza_visita TEXT DEFAULT 'settimanale';
+ALTER TABLE clienti ADD COLUMN IF NOT EXISTS ora_visita_standard TIME;
+ALTER TABLE clienti ADD COLUMN IF NOT EXISTS whatsapp_linked BOOLEAN DEFAULT FALSE;
+ALTER TABLE clienti ADD COLUMN IF NOT EXISTS whatsapp_linked_at TIMESTAMP;
+
+ALTER TABLE clienti_prodotti ADD COLUMN IF NOT EXISTS lavorato BOOLEAN DEFAULT FALSE;
+ALTER TABLE clienti_prodotti ADD COLUMN IF NOT EXISTS data_operazione TIMESTAMP;
+ALTER TABLE clienti_prodotti ADD COLUMN IF NOT EXISTS prezzo_attuale NUMERIC;
+ALTER TABLE clienti_prodotti ADD COLUMN IF NOT EXISTS prezzo_offerta NUMERIC;
+ALTER TABLE clienti_prodotti ADD COLUMN IF NOT EXISTS fornitore_id INTEGER;
+ALTER TABLE clienti_prodotti ADD COLUMN IF NOT EXISTS volte_mancante INTEGER DEFAULT 0;
+ALTER TABLE clienti_prodotti ADD COLUMN IF NOT EXISTS data_inizio_lavorazione DATE;
+ALTER TABLE clienti_prodotti ADD COLUMN IF NOT EXISTS data_fine_lavorazione DATE;
@@ -0,0 +1,12 @@
+-- Tabella del modello SQLAlchemy VolantinoBeta (prima creata da db.create_all()
+-- ad ogni import). api_genera_promo_cliente ci scrive anche via cursore.
+
+CREATE TABLE IF NOT EXISTS volantino_beta (
+    id SERIAL PRIMARY KEY,
+    nome VARCHAR(255) NOT NULL,
+    layout_json TEXT NOT NULL,
+    thumbnail TEXT,
+    tipo VARCHAR(50) DEFAULT 'volantino',
+    creato_il TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    aggiornato_il TIMESTAMP
+);
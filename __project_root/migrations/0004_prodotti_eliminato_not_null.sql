@@ -0,0 +1,8 @@
+-- prodotti.eliminato non ammette più NULL: i filtri possono usare
+-- "eliminato = FALSE" (sargable, usa l'indice parziale) invece di
+-- "COALESCE(eliminato, FALSE) = FALSE".
+-- Su SQLite ALTER COLUMN non esiste: resta il DEFAULT e l'UPDATE dei NULL.
+
+UPDATE prodotti SET eliminato = FALSE WHERE eliminato IS NULL;
+ALTER TABLE prodotti ALTER COLUMN eliminato SET DEFAULT FALSE;
+ALTER TABLE prodotti ALTER COLUMN eliminato SET NOT NULL;
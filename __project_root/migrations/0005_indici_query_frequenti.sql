@@ -0,0 +1,34 @@
+-- Indici per i filtri e le join delle pagine più usate
+-- (dashboard, scheda cliente, analisi settimanale, import PDF, calendario visite).
+-- Verifica dei piani: flask db explain-check
+
+CREATE INDEX IF NOT EXISTS idx_fatturato_cliente_anno_mese
+    ON fatturato (cliente_id, anno, mese);
+
+CREATE INDEX IF NOT EXISTS idx_fatturato_anno_mese
+    ON fatturato (anno, mese);
+
+CREATE INDEX IF NOT EXISTS idx_fatturato_settimanale_cliente_data
+    ON fatturato_settimanale (cliente_id, data_inizio);
+
+CREATE INDEX IF NOT EXISTS idx_acquisti_dettaglio_cliente_update
+    ON acquisti_settimanali_dettaglio (cliente_id, update_id);
+
+CREATE INDEX IF NOT EXISTS idx_acquisti_dettaglio_data_inizio
+    ON acquisti_settimanali_dettaglio (data_inizio);
+
+CREATE INDEX IF NOT EXISTS idx_clienti_prodotti_prodotto_lavorato
+    ON clienti_prodotti (prodotto_id, lavorato);
+
+CREATE INDEX IF NOT EXISTS idx_prodotti_codice
+    ON prodotti (codice);
+
+-- Catalogo: solo i prodotti attivi
+CREATE INDEX IF NOT EXISTS idx_prodotti_categoria_attivi
+    ON prodotti (categoria_id) WHERE eliminato = FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_visite_data
+    ON visite (data_visita);
+
+CREATE INDEX IF NOT EXISTS idx_promozioni_pdf_prodotto_tipo
+    ON promozioni_pdf (prodotto_id, tipo);
@@ -0,0 +1,24 @@
+-- Aggregato mensile del fatturato per (anno, mese, zona, cliente).
+-- Mantenuto nella stessa transazione da ogni scrittura su fatturato
+-- (vedi aggiorna_fatturato_rollup); ricostruzione completa: flask db rebuild-rollup
+
+CREATE TABLE IF NOT EXISTS fatturato_rollup (
+    anno INTEGER NOT NULL,
+    mese INTEGER NOT NULL,
+    zona TEXT NOT NULL DEFAULT '',
+    cliente_id INTEGER NOT NULL,
+    totale REAL NOT NULL DEFAULT 0,
+    righe INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (anno, mese, zona, cliente_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_fatturato_rollup_cliente
+    ON fatturato_rollup (cliente_id, anno, mese);
+
+DELETE FROM fatturato_rollup;
+
+INSERT INTO fatturato_rollup (anno, mese, zona, cliente_id, totale, righe)
+SELECT f.anno, f.mese, COALESCE(c.zona, ''), f.cliente_id, COALESCE(SUM(f.totale), 0), COUNT(*)
+FROM fatturato f
+LEFT JOIN clienti c ON c.id = f.cliente_id
+GROUP BY f.anno, f.mese, COALESCE(c.zona, ''), f.cliente_id;
@@ -0,0 +1,7 @@
+-- clienti.fatturato_totale da qui in poi è aggiornato per differenza (vecchio -> nuovo)
+-- dalle scritture su fatturato e fatturato_settimanale: si parte da un valore esatto.
+-- Verifica/riparazione successive: flask db reconcile-totali
+
+UPDATE clienti SET fatturato_totale =
+    (SELECT COALESCE(SUM(totale), 0) FROM fatturato WHERE cliente_id = clienti.id)
+  + (SELECT COALESCE(SUM(totale), 0) FROM fatturato_settimanale WHERE cliente_id = clienti.id);
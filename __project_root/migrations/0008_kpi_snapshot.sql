@@ -0,0 +1,13 @@
+-- Snapshot condiviso tra i worker degli aggregati della dashboard (vedi kpi_snapshot()).
+-- "generazione" viene incrementata nella stessa transazione di ogni scrittura su
+-- una tabella da cui lo snapshot dipende.
+
+CREATE TABLE IF NOT EXISTS kpi_snapshot (
+    chiave TEXT PRIMARY KEY,
+    generazione INTEGER NOT NULL DEFAULT 0,
+    giorno TEXT,
+    calcolato_il DOUBLE PRECISION,
+    dati TEXT
+);
+
+INSERT INTO kpi_snapshot (chiave) VALUES ('dashboard') ON CONFLICT (chiave) DO NOTHING;
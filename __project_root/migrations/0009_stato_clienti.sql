@@ -0,0 +1,8 @@
+-- Stato cliente persistito (attivo / bloccato / inattivo) e mese da cui è stato calcolato.
+-- Il calcolo è in aggiorna_stato_clienti(); i valori vengono riempiti dal primo
+-- cambio mese (stato_riferimento NULL) o da: flask db refresh-stati
+
+ALTER TABLE clienti ADD COLUMN IF NOT EXISTS stato_riferimento TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_clienti_stato
+    ON clienti (stato);
@@ -0,0 +1,18 @@
+-- Elenco clienti paginato (/api/clienti): ricerca per nome e chiavi keyset.
+-- La ricerca è LIKE '%testo%' sul nome: un B-tree non la può usare,
+-- l'indice trigram sì. Su SQLite vedi 0010_ricerca_clienti.sqlite.sql (FTS5).
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_clienti_nome_trgm
+    ON clienti USING gin (lower(nome) gin_trgm_ops);
+
+-- Un indice per ciascun ordinamento della paginazione keyset
+CREATE INDEX IF NOT EXISTS idx_clienti_ordine_nome
+    ON clienti (lower(nome), id);
+
+CREATE INDEX IF NOT EXISTS idx_clienti_ordine_zona
+    ON clienti (zona, lower(nome), id);
+
+CREATE INDEX IF NOT EXISTS idx_clienti_ordine_fatturato
+    ON clienti (COALESCE(fatturato_totale, 0), id);
@@ -0,0 +1,30 @@
+-- Variante SQLite di 0010_ricerca_clienti.sql: la ricerca per nome usa una
+-- tabella FTS5 con tokenizer trigram (LIKE '%testo%' servito dall'indice),
+-- tenuta allineata a clienti dai trigger.
+
+CREATE VIRTUAL TABLE IF NOT EXISTS clienti_fts
+    USING fts5(nome, content='clienti', content_rowid='id', tokenize='trigram');
+
+CREATE TRIGGER IF NOT EXISTS clienti_fts_ins AFTER INSERT ON clienti BEGIN
+    INSERT INTO clienti_fts (rowid, nome) VALUES (new.id, new.nome);
+END;
+
+CREATE TRIGGER IF NOT EXISTS clienti_fts_del AFTER DELETE ON clienti BEGIN
+    INSERT INTO clienti_fts (clienti_fts, rowid, nome) VALUES ('delete', old.id, old.nome);
+END;
+
+CREATE TRIGGER IF NOT EXISTS clienti_fts_upd AFTER UPDATE OF nome ON clienti BEGIN
+    INSERT INTO clienti_fts (clienti_fts, rowid, nome) VALUES ('delete', old.id, old.nome);
+    INSERT INTO clienti_fts (rowid, nome) VALUES (new.id, new.nome);
+END;
+
+INSERT INTO clienti_fts (clienti_fts) VALUES ('rebuild');
+
+CREATE INDEX IF NOT EXISTS idx_clienti_ordine_nome
+    ON clienti (lower(nome), id);
+
+CREATE INDEX IF NOT EXISTS idx_clienti_ordine_zona
+    ON clienti (zona, lower(nome), id);
+
+CREATE INDEX IF NOT EXISTS idx_clienti_ordine_fatturato
+    ON clienti (COALESCE(fatturato_totale, 0), id);
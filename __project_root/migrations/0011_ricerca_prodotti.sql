@@ -0,0 +1,11 @@
+-- Ricerca nel catalogo (/api/prodotti/catalogo) per nome o codice con
+-- LIKE '%testo%': indici trigram sui soli prodotti attivi.
+-- Su SQLite vedi 0011_ricerca_prodotti.sqlite.sql (FTS5).
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_prodotti_nome_trgm
+    ON prodotti USING gin (lower(nome) gin_trgm_ops) WHERE eliminato = FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_prodotti_codice_trgm
+    ON prodotti USING gin (lower(codice) gin_trgm_ops) WHERE eliminato = FALSE;
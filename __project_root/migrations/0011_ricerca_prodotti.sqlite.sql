@@ -0,0 +1,20 @@
+-- Variante SQLite di 0011_ricerca_prodotti.sql: tabella FTS5 con tokenizer
+-- trigram su nome e codice, tenuta allineata a prodotti dai trigger.
+
+CREATE VIRTUAL TABLE IF NOT EXISTS prodotti_fts
+    USING fts5(nome, codice, content='prodotti', content_rowid='id', tokenize='trigram');
+
+CREATE TRIGGER IF NOT EXISTS prodotti_fts_ins AFTER INSERT ON prodotti BEGIN
+    INSERT INTO prodotti_fts (rowid, nome, codice) VALUES (new.id, new.nome, new.codice);
+END;
+
+CREATE TRIGGER IF NOT EXISTS prodotti_fts_del AFTER DELETE ON prodotti BEGIN
+    INSERT INTO prodotti_fts (prodotti_fts, rowid, nome, codice) VALUES ('delete', old.id, old.nome, old.codice);
+END;
+
+CREATE TRIGGER IF NOT EXISTS prodotti_fts_upd AFTER UPDATE OF nome, codice ON prodotti BEGIN
+    INSERT INTO prodotti_fts (prodotti_fts, rowid, nome, codice) VALUES ('delete', old.id, old.nome, old.codice);
+    INSERT INTO prodotti_fts (rowid, nome, codice) VALUES (new.id, new.nome, new.codice);
+END;
+
+INSERT INTO prodotti_fts (prodotti_fts) VALUES ('rebuild');
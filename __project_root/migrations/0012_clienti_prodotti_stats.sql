@@ -0,0 +1,23 @@
+-- Contatori per cliente del pannello "Gestione prodotti clienti".
+-- Mantenuti nella stessa transazione dalle scritture su clienti_prodotti
+-- (vedi aggiorna_stats_prodotti_clienti); ricostruzione: flask db rebuild-stats-prodotti
+
+CREATE TABLE IF NOT EXISTS clienti_prodotti_stats (
+    cliente_id INTEGER PRIMARY KEY,
+    ultima_importazione TIMESTAMP,
+    count_lavorati INTEGER NOT NULL DEFAULT 0,
+    count_ex INTEGER NOT NULL DEFAULT 0,
+    count_warnings INTEGER NOT NULL DEFAULT 0
+);
+
+DELETE FROM clienti_prodotti_stats;
+
+INSERT INTO clienti_prodotti_stats (cliente_id, ultima_importazione, count_lavorati, count_ex, count_warnings)
+SELECT cp.cliente_id,
+       MAX(cp.data_operazione),
+       SUM(CASE WHEN cp.lavorato = TRUE THEN 1 ELSE 0 END),
+       SUM(CASE WHEN cp.lavorato = FALSE AND cp.data_inizio_lavorazione IS NOT NULL THEN 1 ELSE 0 END),
+       SUM(CASE WHEN cp.lavorato = TRUE AND cp.volte_mancante > 0 THEN 1 ELSE 0 END)
+FROM clienti_prodotti cp
+JOIN clienti c ON c.id = cp.cliente_id
+GROUP BY cp.cliente_id;
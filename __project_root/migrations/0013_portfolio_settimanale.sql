@@ -0,0 +1,49 @@
+-- Cubo settimanale del portfolio per /api/statistiche_portfolio:
+-- fatturato per (settimana, cliente, zona) e prodotti acquistati per
+-- (settimana, prodotto, cliente). Mantenuto per settimana dalle scritture
+-- sull'aggiornamento settimanale (vedi aggiorna_portfolio_settimanale);
+-- ricostruzione: flask db rebuild-portfolio
+
+CREATE TABLE IF NOT EXISTS portfolio_settimanale (
+    data_inizio DATE NOT NULL,
+    cliente_id INTEGER NOT NULL,
+    zona TEXT NOT NULL DEFAULT '',
+    data_fine DATE,
+    totale REAL NOT NULL DEFAULT 0,
+    righe INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (data_inizio, cliente_id, zona)
+);
+
+CREATE INDEX IF NOT EXISTS idx_portfolio_settimanale_cliente
+    ON portfolio_settimanale (cliente_id, data_inizio);
+
+CREATE TABLE IF NOT EXISTS portfolio_settimanale_prodotti (
+    data_inizio DATE NOT NULL,
+    prodotto_id INTEGER NOT NULL,
+    cliente_id INTEGER NOT NULL,
+    quantita REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (data_inizio, prodotto_id, cliente_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_portfolio_prodotti_prodotto
+    ON portfolio_settimanale_prodotti (prodotto_id, data_inizio);
+
+CREATE INDEX IF NOT EXISTS idx_portfolio_prodotti_cliente
+    ON portfolio_settimanale_prodotti (cliente_id, data_inizio);
+
+DELETE FROM portfolio_settimanale;
+
+INSERT INTO portfolio_settimanale (data_inizio, cliente_id, zona, data_fine, totale, righe)
+SELECT f.data_inizio, f.cliente_id, COALESCE(c.zona, ''), MAX(f.data_fine), COALESCE(SUM(f.totale), 0), COUNT(*)
+FROM fatturato_settimanale f
+LEFT JOIN clienti c ON c.id = f.cliente_id
+WHERE f.data_inizio IS NOT NULL
+GROUP BY f.data_inizio, f.cliente_id, COALESCE(c.zona, '');
+
+DELETE FROM portfolio_settimanale_prodotti;
+
+INSERT INTO portfolio_settimanale_prodotti (data_inizio, prodotto_id, cliente_id, quantita)
+SELECT d.data_inizio, d.prodotto_id, d.cliente_id, COALESCE(SUM(d.quantita), 0)
+FROM acquisti_settimanali_dettaglio d
+WHERE d.data_inizio IS NOT NULL AND d.prodotto_id IS NOT NULL
+GROUP BY d.data_inizio, d.prodotto_id, d.cliente_id;
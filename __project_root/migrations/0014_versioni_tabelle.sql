@@ -0,0 +1,8 @@
+-- Contatore di versione per tabella, base degli ETag delle API JSON (vedi dipende_da_tabelle).
+-- Incrementato nella stessa transazione di ogni COMMIT che scrive la tabella.
+
+CREATE TABLE IF NOT EXISTS versioni_tabelle (
+    tabella TEXT PRIMARY KEY,
+    versione BIGINT NOT NULL DEFAULT 0,
+    modificata_il DOUBLE PRECISION
+);
@@ -0,0 +1,12 @@
+-- JSON già serializzato di /api/clienti/<id>/analisi_settimanale per (cliente, update_id).
+-- versione_prodotti: versioni di clienti_prodotti/prodotti/categorie al momento del calcolo;
+-- le righe di un cliente sono cancellate da salva/elimina aggiornamento settimanale.
+
+CREATE TABLE IF NOT EXISTS analisi_settimanale_cache (
+    cliente_id INTEGER NOT NULL,
+    update_id INTEGER NOT NULL,
+    versione_prodotti TEXT NOT NULL,
+    dati TEXT NOT NULL,
+    calcolato_il DOUBLE PRECISION,
+    PRIMARY KEY (cliente_id, update_id)
+);
@@ -0,0 +1,52 @@
+-- Finestra mobile delle ultime 12 settimane per cliente (TREND_FINESTRA_MAX) con
+-- quantità e spesa per prodotto, fonte di /api/clienti/<id>/statistiche_settimanali_4w.
+-- Fatta scorrere dalle scritture sull'aggiornamento settimanale (vedi
+-- aggiorna_trend_settimanale); ricostruzione: flask db rebuild-trend
+
+CREATE TABLE IF NOT EXISTS trend_settimane (
+    cliente_id INTEGER NOT NULL,
+    update_id INTEGER NOT NULL,
+    data_inizio DATE,
+    data_fine DATE,
+    totale REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (cliente_id, update_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_trend_settimane_ordine
+    ON trend_settimane (cliente_id, data_inizio, update_id);
+
+-- chiave: prodotto_id, oppure 'pdf_' || nome_pdf per le righe PDF non abbinate
+CREATE TABLE IF NOT EXISTS trend_settimane_prodotti (
+    cliente_id INTEGER NOT NULL,
+    update_id INTEGER NOT NULL,
+    chiave TEXT NOT NULL,
+    prodotto_id INTEGER,
+    codice_pdf TEXT,
+    nome_pdf TEXT,
+    um_pdf TEXT,
+    quantita REAL NOT NULL DEFAULT 0,
+    euro REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (cliente_id, update_id, chiave)
+);
+
+DELETE FROM trend_settimane;
+
+INSERT INTO trend_settimane (cliente_id, update_id, data_inizio, data_fine, totale)
+SELECT cliente_id, id, data_inizio, data_fine, COALESCE(totale, 0)
+FROM (
+    SELECT f.*, ROW_NUMBER() OVER (PARTITION BY f.cliente_id ORDER BY f.data_inizio DESC, f.id DESC) AS posizione
+    FROM fatturato_settimanale f
+    WHERE f.id IS NOT NULL
+) AS ultime
+WHERE posizione <= 12;
+
+DELETE FROM trend_settimane_prodotti;
+
+INSERT INTO trend_settimane_prodotti (cliente_id, update_id, chiave, prodotto_id, codice_pdf, nome_pdf, um_pdf, quantita, euro)
+SELECT d.cliente_id, d.update_id, COALESCE(CAST(d.prodotto_id AS TEXT), 'pdf_' || COALESCE(d.nome_pdf, '')),
+       MAX(d.prodotto_id), MAX(d.codice_pdf), MAX(d.nome_pdf), MAX(d.um_pdf),
+       SUM(COALESCE(NULLIF(d.quantita, 0), 1)),
+       SUM(COALESCE(NULLIF(d.quantita, 0), 1) * COALESCE(d.prezzo_pdf, 0))
+FROM acquisti_settimanali_dettaglio d
+JOIN trend_settimane t ON t.cliente_id = d.cliente_id AND t.update_id = d.update_id
+GROUP BY d.cliente_id, d.update_id, COALESCE(CAST(d.prodotto_id AS TEXT), 'pdf_' || COALESCE(d.nome_pdf, ''));
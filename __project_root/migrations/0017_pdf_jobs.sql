@@ -0,0 +1,30 @@
+-- Coda dei lavori PDF eseguiti in background (vedi pdf_in_coda), senza broker esterno.
+-- stato: in_coda -> in_corso -> completato | errore | annullato.
+-- richiesta: JSON con quanto serve a rieseguire la view (view_args, form, campo file, referrer).
+-- I tempi sono epoch in secondi; battito_il è aggiornato dal processo che esegue il lavoro.
+
+CREATE TABLE IF NOT EXISTS pdf_jobs (
+    id SERIAL PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    percorso TEXT NOT NULL,
+    richiesta TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    nome_file TEXT,
+    stato TEXT NOT NULL DEFAULT 'in_coda',
+    tentativi INTEGER NOT NULL DEFAULT 0,
+    max_tentativi INTEGER NOT NULL DEFAULT 3,
+    annulla BOOLEAN NOT NULL DEFAULT FALSE,
+    pagine_totali INTEGER,
+    pagine_elaborate INTEGER NOT NULL DEFAULT 0,
+    prodotti_trovati INTEGER,
+    prodotti_abbinati INTEGER NOT NULL DEFAULT 0,
+    risultato TEXT,
+    errore TEXT,
+    worker TEXT,
+    creato_il DOUBLE PRECISION NOT NULL,
+    avviato_il DOUBLE PRECISION,
+    battito_il DOUBLE PRECISION,
+    terminato_il DOUBLE PRECISION
+);
+
+CREATE INDEX IF NOT EXISTS idx_pdf_jobs_stato ON pdf_jobs (stato, id);
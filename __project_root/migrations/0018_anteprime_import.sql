@@ -0,0 +1,13 @@
+-- Anteprime dell'import PDF cliente tra il caricamento e la conferma (vedi salva_anteprima_import).
+-- Condivise da tutti i worker; utente: id della sessione del browser. dati: JSON compresso (zlib, base64).
+
+CREATE TABLE IF NOT EXISTS anteprime_import (
+    utente TEXT NOT NULL,
+    chiave TEXT NOT NULL,
+    dati TEXT NOT NULL,
+    creata_il DOUBLE PRECISION NOT NULL,
+    scade_il DOUBLE PRECISION NOT NULL,
+    PRIMARY KEY (utente, chiave)
+);
+
+CREATE INDEX IF NOT EXISTS idx_anteprime_import_scade ON anteprime_import (scade_il);
@@ -0,0 +1,10 @@
+-- /api/clienti?order=fatturato: su PostgreSQL fatturato_totale è REAL (float4), mentre
+-- il cursore keyset torna dal client come float8. Confrontati così, il valore dell'ultima
+-- riga non coincideva con quello salvato e le righe a pari fatturato venivano saltate.
+-- La chiave di ordinamento è ora la conversione (esatta) in DOUBLE PRECISION e l'indice
+-- di 0010 segue la nuova espressione.
+
+DROP INDEX IF EXISTS idx_clienti_ordine_fatturato;
+
+CREATE INDEX IF NOT EXISTS idx_clienti_ordine_fatturato
+    ON clienti (CAST(COALESCE(fatturato_totale, 0) AS DOUBLE PRECISION), id);
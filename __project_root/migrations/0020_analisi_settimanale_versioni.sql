@@ -0,0 +1,9 @@
+-- Versione per cliente dell'analisi settimanale (vedi analisi_settimanale_json):
+-- incrementata nella stessa transazione dalle scritture sugli aggiornamenti
+-- settimanali e sui prodotti del cliente. Le righe di analisi_settimanale_cache
+-- calcolate con una versione diversa valgono come miss.
+
+CREATE TABLE IF NOT EXISTS analisi_settimanale_versioni (
+    cliente_id INTEGER PRIMARY KEY,
+    versione BIGINT NOT NULL DEFAULT 0
+);
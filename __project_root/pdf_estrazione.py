@@ -0,0 +1,22 @@
+# Estrazione delle pagine PDF nel modello usato dai parser di app.py.
+# Modulo volutamente leggero (solo pdfplumber): è quello che i processi del pool di
+# estrazione parallela importano, senza ricaricare l'app, le connessioni e i thread.
+import pdfplumber
+
+PDF_TABELLE_TESTO = {
+    "vertical_strategy": "text",
+    "horizontal_strategy": "text",
+    "snap_tolerance": 3,
+}
+
+def modello_pagina(page, indice, tabelle=True):
+    pagina = {"indice": indice, "righe": (page.extract_text() or "").splitlines(), "tabelle": []}
+    if tabelle:
+        # Prova prima con la strategia standard, poi con l'allineamento del testo
+        pagina["tabelle"] = page.extract_tables() or page.extract_tables(PDF_TABELLE_TESTO) or []
+    return pagina
+
+def estrai_pagine(pdf_path, inizio, fine, tabelle):
+    """Modelli delle pagine [inizio, fine); eseguita anche nei processi del pool."""
+    with pdfplumber.open(pdf_path) as pdf:
+        return [modello_pagina(pdf.pages[i], i, tabelle) for i in range(inizio, fine)]